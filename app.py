@@ -6,19 +6,28 @@ Main Streamlit Application
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
 
 import config
 import auth
 import db_manager
 from utils import (
-    auto_categorize_transaction,
     apply_rules_to_transactions,
-    calculate_budget_progress
+    auto_categorize_payees,
+    calculate_budget_progress,
+    get_current_month
 )
 
 
+# Columns written for each imported CSV row, and defaults for optional ones
+IMPORT_OPTIONAL_COLUMNS = {
+    'account_name': '',
+    'account_id': '',
+    'notes': '',
+    'pending': False
+}
+IMPORT_COLUMNS = ['date', 'payee', 'amount', 'category'] + list(IMPORT_OPTIONAL_COLUMNS)
+
+
 # =====================================
 # Page Configuration
 # =====================================
@@ -127,6 +136,29 @@ def show_login_page():
 # Main Dashboard
 # =====================================
 
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+def build_category_bar(category_spending: tuple):
+    """
+    Build the "Spending by Category" bar chart (cached)
+
+    Args:
+        category_spending: Tuple of (category, amount) pairs, sorted for display
+
+    Returns:
+        Plotly bar chart figure
+    """
+    import plotly.express as px  # Imported lazily; only the dashboard draws charts
+
+    categories, amounts = zip(*category_spending)
+
+    return px.bar(
+        x=list(categories),
+        y=list(amounts),
+        labels={'x': 'Category', 'y': 'Amount ($)'},
+        title="Spending by Category"
+    )
+
+
 def show_dashboard():
     """Display the main dashboard"""
     st.title(f"{config.APP_ICON} {config.APP_NAME} Dashboard")
@@ -144,14 +176,13 @@ def show_dashboard():
     # Calculate metrics
     if len(transactions_df) > 0:
         # Filter to current month
-        current_month = datetime.now().strftime(config.MONTH_YEAR_FORMAT)
-        this_month_df = transactions_df[
-            transactions_df['date'].dt.strftime(config.MONTH_YEAR_FORMAT) == current_month
-        ]
+        current_period = get_current_month()
+        this_month_df = transactions_df.loc[transactions_df['_period_m'] == current_period]
 
         total_balance = transactions_df['amount'].sum()
-        monthly_spending = this_month_df[this_month_df['amount'] < 0]['amount'].sum()
-        monthly_income = this_month_df[this_month_df['amount'] > 0]['amount'].sum()
+        amounts = this_month_df['amount'].to_numpy()
+        monthly_spending = amounts[amounts < 0].sum()
+        monthly_income = amounts[amounts > 0].sum()
         transaction_count = len(this_month_df)
 
         # Display metrics
@@ -175,16 +206,12 @@ def show_dashboard():
         if len(this_month_df) > 0:
             st.subheader("Spending by Category (This Month)")
 
-            category_spending = this_month_df[this_month_df['amount'] < 0].groupby('category')['amount'].sum().abs()
+            expenses_df = this_month_df.loc[this_month_df['amount'] < 0]
+            category_spending = -expenses_df.groupby('category', observed=True)['amount'].sum()
             category_spending = category_spending.sort_values(ascending=False)
 
             if len(category_spending) > 0:
-                fig = px.bar(
-                    x=category_spending.index,
-                    y=category_spending.values,
-                    labels={'x': 'Category', 'y': 'Amount ($)'},
-                    title="Spending by Category"
-                )
+                fig = build_category_bar(tuple(category_spending.items()))
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 st.info("No spending data for this month")
@@ -193,9 +220,9 @@ def show_dashboard():
 
         # Recent transactions
         st.subheader("Recent Transactions")
-        display_df = transactions_df.head(10)[['date', 'payee', 'category', 'amount', 'account_name']]
+        display_df = transactions_df[['date', 'payee', 'category', 'amount', 'account_name']].head(10).copy()
         display_df['date'] = display_df['date'].dt.strftime('%Y-%m-%d')
-        display_df['amount'] = display_df['amount'].apply(lambda x: f"${x:,.2f}")
+        display_df['amount'] = display_df['amount'].map('${:,.2f}'.format)
         st.dataframe(display_df, use_container_width=True, hide_index=True)
 
     else:
@@ -234,23 +261,15 @@ def show_transactions_page():
                 if st.button("Import Transactions", use_container_width=True):
                     with st.spinner("Importing transactions..."):
                         # Prepare transactions
-                        transactions = []
-
-                        for _, row in df.iterrows():
-                            # Auto-categorize
-                            category = auto_categorize_transaction(row['payee'])
-
-                            txn = {
-                                'date': row['date'],
-                                'payee': row['payee'],
-                                'amount': float(row['amount']),
-                                'category': category,
-                                'account_name': row.get('account_name', ''),
-                                'account_id': row.get('account_id', ''),
-                                'notes': row.get('notes', ''),
-                                'pending': row.get('pending', False)
-                            }
-                            transactions.append(txn)
+                        import_df = df.assign(
+                            amount=pd.to_numeric(df['amount'], errors='coerce'),
+                            category=auto_categorize_payees(df['payee'])
+                        )
+                        for col, default in IMPORT_OPTIONAL_COLUMNS.items():
+                            if col not in import_df.columns:
+                                import_df[col] = default
+
+                        transactions = import_df[IMPORT_COLUMNS].to_dict(orient='records')
 
                         # Batch add
                         success = db_manager.batch_add_transactions(user_id, transactions)
@@ -277,7 +296,7 @@ def show_transactions_page():
         col1, col2 = st.columns(2)
 
         with col1:
-            categories = ['All'] + sorted(transactions_df['category'].unique().tolist())
+            categories = ['All'] + list(transactions_df['category'].cat.categories)
             selected_category = st.selectbox("Filter by Category", categories)
 
         with col2:
@@ -289,20 +308,25 @@ def show_transactions_page():
                 step=7
             )
 
+        # Select displayed columns first so row filters only copy those
+        display_df = transactions_df[['date', 'payee', 'category', 'amount', 'account_name', 'transaction_id']]
+
         # Apply filters
         cutoff_date = datetime.now() - timedelta(days=date_range)
-        filtered_df = transactions_df[transactions_df['date'] >= cutoff_date]
+        display_df = display_df[display_df['date'] >= cutoff_date]
 
         if selected_category != 'All':
-            filtered_df = filtered_df[filtered_df['category'] == selected_category]
+            display_df = display_df[display_df['category'] == selected_category]
 
-        st.write(f"Showing {len(filtered_df)} transactions")
+        st.write(f"Showing {len(display_df)} transactions")
 
-        # Display transactions
-        display_df = filtered_df[['date', 'payee', 'category', 'amount', 'account_name', 'transaction_id']]
-        display_df['date'] = display_df['date'].dt.strftime('%Y-%m-%d')
-
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
+        # Display transactions (dates stay datetime64 and are formatted by the frontend)
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={'date': st.column_config.DateColumn('date', format='YYYY-MM-DD')}
+        )
 
     else:
         st.info("No transactions found. Upload a CSV to get started!")
@@ -322,8 +346,9 @@ def show_categorization_page():
         transactions_df = db_manager.load_user_transactions(user_id)
 
     if len(transactions_df) > 0:
-        # Filter uncategorized
-        uncategorized = transactions_df[transactions_df['category'] == 'Uncategorized']
+        # Filter uncategorized by comparing category codes
+        uncategorized_code = transactions_df['category'].cat.categories.get_loc('Uncategorized')
+        uncategorized = transactions_df.loc[transactions_df['category'].cat.codes == uncategorized_code]
 
         st.write(f"**{len(uncategorized)}** uncategorized transactions")
 
@@ -348,7 +373,7 @@ def show_categorization_page():
 
             with col1:
                 if st.button("Save Category", use_container_width=True):
-                    success = db_manager.update_transaction_category(txn['transaction_id'], category)
+                    success = db_manager.update_transaction_category(user_id, txn['transaction_id'], category)
 
                     if success:
                         st.success("Category updated!")
@@ -377,7 +402,8 @@ def show_budgets_page():
     st.title("Monthly Budgets")
 
     user_id = auth.get_current_user_id()
-    current_month = datetime.now().strftime(config.MONTH_YEAR_FORMAT)
+    current_period = get_current_month()
+    current_month = str(current_period)  # YYYY-MM
 
     st.subheader(f"Budget for {current_month}")
 
@@ -407,17 +433,15 @@ def show_budgets_page():
 
     if len(budgets_df) > 0:
         # Calculate spending
-        this_month_df = transactions_df[
-            transactions_df['date'].dt.strftime(config.MONTH_YEAR_FORMAT) == current_month
-        ]
+        this_month_df = transactions_df.loc[transactions_df['_period_m'] == current_period]
 
         budget_progress = calculate_budget_progress(budgets_df, this_month_df)
 
         # Display budget progress
-        for _, budget in budget_progress.iterrows():
-            category = budget['category']
-            budgeted = budget['budgeted']
-            spent = abs(budget['spent'])
+        for budget in budget_progress.itertuples(index=False):
+            category = budget.category
+            budgeted = budget.budgeted
+            spent = abs(budget.spent)
             remaining = budgeted - spent
             percent = (spent / budgeted * 100) if budgeted > 0 else 0
 
@@ -504,7 +528,7 @@ def show_rules_page():
                 updates = apply_rules_to_transactions(transactions_df, rules_df)
 
                 if len(updates) > 0:
-                    success = db_manager.batch_update_transaction_categories(updates)
+                    success = db_manager.batch_update_transaction_categories(user_id, updates)
 
                     if success:
                         st.success(f"Applied rules to {len(updates)} transactions!")
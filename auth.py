@@ -3,16 +3,30 @@ Authentication module for FinDash
 Handles user registration, login, password hashing, and session management
 """
 
-import bcrypt
+import copy
 import uuid
 from datetime import datetime, timedelta
 import streamlit as st
 from typing import Optional, Dict, Any
 import re
+import string
 
 import config
 
 
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Initial session state values (copied per session so mutable defaults aren't shared)
+SESSION_DEFAULTS = {
+    config.SESSION_LOGGED_IN: False,
+    config.SESSION_USER_ID: None,
+    config.SESSION_USER_EMAIL: None,
+    config.SESSION_USER_NAME: None,
+    config.SESSION_DATA_CACHE: {},
+    config.SESSION_LAST_SYNC: None,
+}
+
+
 def hash_password(password: str) -> str:
     """
     Hash a password using bcrypt
@@ -23,7 +37,9 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password as string
     """
-    salt = bcrypt.gensalt()
+    import bcrypt
+
+    salt = bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -39,6 +55,8 @@ def verify_password(password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    import bcrypt
+
     try:
         return bcrypt.checkpw(
             password.encode('utf-8'),
@@ -58,8 +76,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email format, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_PATTERN.match(email) is not None
 
 
 def validate_password_strength(password: str) -> tuple[bool, str]:
@@ -75,13 +92,16 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
 
-    if not re.search(r'[A-Z]', password):
+    # Single pass over the password, then cheap set checks per character class
+    chars = set(password)
+
+    if chars.isdisjoint(string.ascii_uppercase):
         return False, "Password must contain at least one uppercase letter"
 
-    if not re.search(r'[a-z]', password):
+    if chars.isdisjoint(string.ascii_lowercase):
         return False, "Password must contain at least one lowercase letter"
 
-    if not re.search(r'[0-9]', password):
+    if chars.isdisjoint(string.digits):
         return False, "Password must contain at least one number"
 
     return True, ""
@@ -118,23 +138,8 @@ def init_session_state():
     """
     Initialize session state variables if they don't exist
     """
-    if config.SESSION_LOGGED_IN not in st.session_state:
-        st.session_state[config.SESSION_LOGGED_IN] = False
-
-    if config.SESSION_USER_ID not in st.session_state:
-        st.session_state[config.SESSION_USER_ID] = None
-
-    if config.SESSION_USER_EMAIL not in st.session_state:
-        st.session_state[config.SESSION_USER_EMAIL] = None
-
-    if config.SESSION_USER_NAME not in st.session_state:
-        st.session_state[config.SESSION_USER_NAME] = None
-
-    if config.SESSION_DATA_CACHE not in st.session_state:
-        st.session_state[config.SESSION_DATA_CACHE] = {}
-
-    if config.SESSION_LAST_SYNC not in st.session_state:
-        st.session_state[config.SESSION_LAST_SYNC] = None
+    for key, default in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, copy.copy(default))
 
 
 def login_user(user_id: str, email: str, full_name: str):
@@ -156,12 +161,8 @@ def logout_user():
     """
     Log out the current user by clearing session state
     """
-    st.session_state[config.SESSION_LOGGED_IN] = False
-    st.session_state[config.SESSION_USER_ID] = None
-    st.session_state[config.SESSION_USER_EMAIL] = None
-    st.session_state[config.SESSION_USER_NAME] = None
-    st.session_state[config.SESSION_DATA_CACHE] = {}
-    st.session_state[config.SESSION_LAST_SYNC] = None
+    for key, default in SESSION_DEFAULTS.items():
+        st.session_state[key] = copy.copy(default)
 
 
 def is_logged_in() -> bool:
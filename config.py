@@ -39,6 +39,9 @@ CACHE_TTL = 300  # 5 minutes
 # Default transaction display limit
 DEFAULT_TRANSACTION_LIMIT = 60  # days
 
+# bcrypt cost factor for new password hashes (existing hashes keep their own)
+BCRYPT_ROUNDS = 10
+
 # =====================================
 # Categories (Default)
 # =====================================
@@ -3,8 +3,6 @@ Database Manager for FinDash
 Handles all Google Sheets operations with smart caching and batching
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
 import pandas as pd
 import streamlit as st
 from datetime import datetime
@@ -22,6 +20,9 @@ def get_gspread_client():
     Returns:
         Authorized gspread client
     """
+    import gspread
+    from google.oauth2.service_account import Credentials
+
     try:
         creds = Credentials.from_service_account_file(
             config.SERVICE_ACCOUNT_FILE,
@@ -33,6 +34,37 @@ def get_gspread_client():
         return None
 
 
+@st.cache_resource(ttl=config.CACHE_TTL, show_spinner=False)
+def _open_spreadsheet(client_id: int, _client):
+    """
+    Open the FinDash spreadsheet (cached per client; open_by_key costs a metadata request)
+
+    Args:
+        client_id: id() of the gspread client, so a new client opens a fresh handle
+        _client: Authorized gspread client (not hashed)
+
+    Returns:
+        gspread Spreadsheet object
+    """
+    return _client.open_by_key(config.SPREADSHEET_ID)
+
+
+@st.cache_resource(ttl=config.CACHE_TTL, show_spinner=False)
+def _open_worksheet(client_id: int, sheet_name: str, _spreadsheet):
+    """
+    Look up a worksheet by name (cached per client; the lookup costs a metadata request)
+
+    Args:
+        client_id: id() of the gspread client, so a new client looks the sheet up again
+        sheet_name: Worksheet title
+        _spreadsheet: Spreadsheet opened with that client (not hashed)
+
+    Returns:
+        gspread Worksheet object
+    """
+    return _spreadsheet.worksheet(sheet_name)
+
+
 def get_spreadsheet():
     """
     Get the FinDash spreadsheet
@@ -45,13 +77,343 @@ def get_spreadsheet():
         return None
 
     try:
-        return client.open_by_key(config.SPREADSHEET_ID)
+        return _open_spreadsheet(id(client), client)
     except Exception as e:
         st.error(f"Failed to open spreadsheet: {e}")
         st.info("Make sure SPREADSHEET_ID is set in config.py")
         return None
 
 
+def get_worksheet(sheet_name: str):
+    """
+    Get a worksheet by name
+
+    Args:
+        sheet_name: Worksheet title (one of the config.SHEET_* names)
+
+    Returns:
+        gspread Worksheet object, or None if the spreadsheet is unavailable
+    """
+    spreadsheet = get_spreadsheet()
+    if not spreadsheet:
+        return None
+
+    return _open_worksheet(id(get_gspread_client()), sheet_name, spreadsheet)
+
+
+def _drop_sheet_handles():
+    """
+    Forget cached spreadsheet and worksheet handles so the next call looks them up again
+    (e.g. after a sheet was recreated by setup_sheets.py)
+    """
+    _open_spreadsheet.clear()
+    _open_worksheet.clear()
+
+
+def _now_timestamp() -> str:
+    """
+    Get the current time as a config.DATETIME_FORMAT string
+
+    Returns:
+        Timestamp string for created_at / modified_at columns
+    """
+    now = datetime.now()
+
+    # isoformat is a single C call and yields the same text as the default format
+    if config.DATETIME_FORMAT == '%Y-%m-%d %H:%M:%S':
+        return now.isoformat(sep=' ', timespec='seconds')
+
+    return now.strftime(config.DATETIME_FORMAT)
+
+
+def _to_arrow_strings(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Convert string columns to pyarrow-backed dtypes
+
+    Streamlit ships DataFrames to the browser as Arrow, so storing strings
+    as Arrow up front avoids a conversion on every render.
+
+    Args:
+        df: DataFrame to convert
+        columns: Columns to convert (missing columns are skipped)
+
+    Returns:
+        DataFrame with converted columns
+    """
+    present = [col for col in columns if col in df.columns]
+    return df.astype({col: 'string[pyarrow]' for col in present})
+
+
+# =====================================
+# Sheet Parsing
+# =====================================
+
+# Ranges covering each data sheet's columns
+TRANSACTIONS_RANGE = 'A:L'
+RULES_RANGE = 'A:H'
+BUDGETS_RANGE = 'A:F'
+
+
+def _padded(row: List[Any], width: int) -> List[Any]:
+    """
+    Pad a sheet row with blank cells to the header's width
+
+    Args:
+        row: Row values (the values API omits trailing blank cells)
+        width: Number of header columns
+
+    Returns:
+        Row with exactly width values
+    """
+    return row + [''] * (width - len(row))
+
+
+def _transactions_frame(values: List[List[Any]], user_id: str) -> pd.DataFrame:
+    """
+    Build a user's transactions DataFrame from raw Transactions sheet values
+
+    Args:
+        values: Sheet values including the header row (UNFORMATTED_VALUE)
+        user_id: User ID to keep
+
+    Returns:
+        DataFrame with transactions, newest first
+    """
+    if len(values) < 2:
+        return pd.DataFrame()
+
+    # Filter rows before building the DataFrame (column A is user_id), so the
+    # conversions below run on a fresh, user-sized frame rather than a slice
+    width = len(values[0])
+    rows = [_padded(row, width) for row in values[1:] if row and row[0] == user_id]
+    df = pd.DataFrame(rows, columns=values[0])
+
+    # Convert date column to datetime and precompute the month for page filters
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'], format=config.DATE_FORMAT, errors='coerce', cache=True)
+        df['_period_m'] = df['date'].dt.to_period('M')
+
+    # Amounts arrive typed; to_numeric only does work if the sheet has text in the column.
+    # Kept as float64: float32 would lose cents on long-running balance sums
+    if 'amount' in df.columns:
+        df['amount'] = pd.to_numeric(df['amount'], errors='coerce').astype('float64')
+
+    df = _to_arrow_strings(df, ['transaction_id', 'payee', 'account_id'])
+
+    # Low-cardinality columns (one user, a handful of accounts) as Categoricals
+    df = df.astype({col: 'category' for col in ['user_id', 'account_name'] if col in df.columns})
+
+    # Dictionary-encode category, keeping any custom categories found in the sheet
+    if 'category' in df.columns:
+        extra = sorted(set(df['category'].dropna().unique()) - set(config.DEFAULT_CATEGORIES))
+        df['category'] = pd.Categorical(df['category'], categories=config.DEFAULT_CATEGORIES + extra)
+
+    # Sort by date descending
+    if len(df) > 0:
+        df = df.sort_values('date', ascending=False)
+
+    return df
+
+
+def _rules_frame(values: List[List[Any]], user_id: str) -> pd.DataFrame:
+    """
+    Build a user's rules DataFrame from raw User_Rules sheet values
+
+    Args:
+        values: Sheet values including the header row (UNFORMATTED_VALUE)
+        user_id: User ID to keep
+
+    Returns:
+        DataFrame with rules sorted by priority
+    """
+    if len(values) < 2:
+        return pd.DataFrame()
+
+    # Filter rows before building the DataFrame (column A is user_id)
+    width = len(values[0])
+    rows = [_padded(row, width) for row in values[1:] if row and row[0] == user_id]
+    df = pd.DataFrame(rows, columns=values[0])
+    df = _to_arrow_strings(df, ['rule_id', 'rule_field', 'rule_condition', 'rule_value', 'rule_category'])
+
+    # Sort by priority
+    if len(df) > 0 and 'priority' in df.columns:
+        df = df.sort_values('priority', ascending=True)
+
+    return df
+
+
+def _budgets_frame(values: List[List[Any]], user_id: str, month_year: Optional[str] = None) -> pd.DataFrame:
+    """
+    Build a user's budgets DataFrame from raw Budget_Monthly sheet values
+
+    Args:
+        values: Sheet values including the header row (UNFORMATTED_VALUE)
+        user_id: User ID to keep
+        month_year: Optional month filter (YYYY-MM format)
+
+    Returns:
+        DataFrame with budgets
+    """
+    if len(values) < 2:
+        return pd.DataFrame()
+
+    # Filter rows before building the DataFrame (columns A and B are user_id, month_year)
+    width = len(values[0])
+    rows = [
+        _padded(row, width) for row in values[1:]
+        if row and row[0] == user_id and (not month_year or row[1:2] == [month_year])
+    ]
+    df = pd.DataFrame(rows, columns=values[0])
+    df = _to_arrow_strings(df, ['month_year', 'category'])
+
+    return df
+
+
+# =====================================
+# Row Indexes
+# =====================================
+
+def _build_row_index(values: List[Any]) -> Dict[Any, int]:
+    """
+    Map each value in a column to its 1-based sheet row (first occurrence wins)
+
+    Args:
+        values: Column values (or tuples of key columns) including the header row
+
+    Returns:
+        Dictionary of value -> row number, excluding the header
+    """
+    index = {}
+    for row_index, value in enumerate(values[1:], start=2):
+        index.setdefault(value, row_index)
+    return index
+
+
+@st.cache_resource(ttl=config.CACHE_TTL, show_spinner=False)
+def get_email_row_index() -> Dict[str, int]:
+    """
+    Get the email -> row index for the Users sheet (cached until a user is added)
+
+    Returns:
+        Dictionary of email -> row number
+    """
+    users_sheet = get_worksheet(config.SHEET_USERS)
+    return _build_row_index(users_sheet.col_values(3))  # Column C (email)
+
+
+@st.cache_resource(ttl=config.CACHE_TTL, show_spinner=False)
+def get_transaction_row_index() -> Dict[str, int]:
+    """
+    Get the transaction_id -> row index for the Transactions sheet
+    (cached until transactions are added)
+
+    Returns:
+        Dictionary of transaction_id -> row number
+    """
+    transactions_sheet = get_worksheet(config.SHEET_TRANSACTIONS)
+    return _build_row_index(transactions_sheet.col_values(2))  # Column B (transaction_id)
+
+
+@st.cache_resource(ttl=config.CACHE_TTL, show_spinner=False)
+def get_budget_row_index() -> Dict[tuple[str, str, str], int]:
+    """
+    Get the (user_id, month_year, category) -> row index for the Budget_Monthly sheet
+    (cached until a budget is added)
+
+    Returns:
+        Dictionary of (user_id, month_year, category) -> row number
+    """
+    budget_sheet = get_worksheet(config.SHEET_BUDGET_MONTHLY)
+    rows = budget_sheet.get('A:C')  # user_id, month_year, category
+    return _build_row_index([tuple(row) for row in rows])
+
+
+# Above this many keys, rebuilding the index from one column read is cheaper than
+# verifying each row (batchGet sends every range in the request URL)
+VERIFY_MAX_RANGES = 20
+
+
+def _verified_rows(sheet, get_index, column: str, keys: List[Any]) -> Dict[Any, int]:
+    """
+    Look up keys in a cached row index, confirming each row still holds its key
+
+    The index is rebuilt once if a key is missing or its row no longer matches,
+    so a write never lands on a row that moved since the index was cached.
+    Large lookups skip the per-row check and rebuild the index up front.
+
+    Args:
+        sheet: Worksheet the index was built from
+        get_index: Cached row index function for that sheet
+        column: Column letter holding the key, or a span such as 'A:C' for tuple keys
+        keys: Keys to look up (tuples of the span's cells for a span)
+
+    Returns:
+        Dictionary of key -> row number for the keys found at their indexed row
+    """
+    keys = list(dict.fromkeys(keys))
+
+    if len(keys) > VERIFY_MAX_RANGES:
+        get_index.clear()
+        index = get_index()
+        return {key: index[key] for key in keys if key in index}
+
+    first, _, last = column.partition(':')
+    verified = {}
+
+    for attempt in range(2):
+        index = get_index()
+        rows = {key: index[key] for key in keys if key in index}
+
+        # Read every indexed key cell in one request
+        ranges = [f'{first}{row}:{last}{row}' if last else f'{first}{row}' for row in rows.values()]
+        cells = sheet.batch_get(ranges) if rows else []
+        verified = {
+            key: row
+            for (key, row), cell in zip(rows.items(), cells)
+            if cell and cell[0] and (tuple(cell[0]) if last else cell[0][0]) == key
+        }
+
+        if len(verified) == len(keys) or attempt:
+            break
+        get_index.clear()
+
+    return verified
+
+
+# =====================================
+# Per-User Cache Versions
+# =====================================
+
+# Cached loaders take the user's current version as part of their key, so
+# bumping it invalidates that user's cached data without touching anyone else's
+_data_versions: Dict[tuple[str, str], int] = {}
+
+
+def _get_data_version(kind: str, user_id: str) -> int:
+    """
+    Get the current cache version of a user's data
+
+    Args:
+        kind: Data kind ("transactions", "rules" or "budgets")
+        user_id: User ID
+
+    Returns:
+        Version number
+    """
+    return _data_versions.get((kind, user_id), 0)
+
+
+def _invalidate_user_data(kind: str, user_id: str):
+    """
+    Invalidate a user's cached data of one kind
+
+    Args:
+        kind: Data kind ("transactions", "rules" or "budgets")
+        user_id: User ID
+    """
+    _data_versions[(kind, user_id)] = _get_data_version(kind, user_id) + 1
+
+
 # =====================================
 # User Operations
 # =====================================
@@ -69,20 +431,19 @@ def create_user(full_name: str, email: str, hashed_password: str) -> Optional[st
         User ID if successful, None otherwise
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        users_sheet = get_worksheet(config.SHEET_USERS)
+        if not users_sheet:
             return None
 
-        users_sheet = spreadsheet.worksheet(config.SHEET_USERS)
-
-        # Check if email already exists
-        emails = users_sheet.col_values(3)  # Column C (email)
-        if email in emails[1:]:  # Skip header
+        # Check if email already exists, against a fresh index so a user added
+        # since the index was cached is not duplicated
+        get_email_row_index.clear()
+        if email in get_email_row_index():
             st.error("Email already exists")
             return None
 
         user_id = str(uuid.uuid4())
-        created_at = datetime.now().strftime(config.DATETIME_FORMAT)
+        created_at = _now_timestamp()
 
         # Append new user
         users_sheet.append_row([
@@ -94,9 +455,10 @@ def create_user(full_name: str, email: str, hashed_password: str) -> Optional[st
             '',  # token_expiry
             created_at
         ])
+        get_email_row_index.clear()
 
         # Also create an entry in User_Data
-        user_data_sheet = spreadsheet.worksheet(config.SHEET_USER_DATA)
+        user_data_sheet = get_worksheet(config.SHEET_USER_DATA)
         user_data_sheet.append_row([
             user_id,
             '',  # simplefin_access_url
@@ -107,6 +469,7 @@ def create_user(full_name: str, email: str, hashed_password: str) -> Optional[st
         return user_id
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to create user: {e}")
         return None
 
@@ -122,22 +485,37 @@ def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
         Dictionary with user data, or None if not found
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        users_sheet = get_worksheet(config.SHEET_USERS)
+        if not users_sheet:
             return None
 
-        users_sheet = spreadsheet.worksheet(config.SHEET_USERS)
+        for attempt in range(2):
+            row_index = get_email_row_index().get(email)
+            if row_index is None:
+                if attempt:
+                    return None
 
-        # Get all records
-        records = users_sheet.get_all_records()
+                # The user may have been added since the index was cached
+                get_email_row_index.clear()
+                continue
 
-        for record in records:
-            if record['email'] == email:
+            # Fetch the header and the user's row in one request
+            header_range, row_range = users_sheet.batch_get(['1:1', f'{row_index}:{row_index}'])
+            header = header_range[0] if header_range else []
+            row = row_range[0] if row_range else []
+            row = row + [''] * (len(header) - len(row))  # Trailing blank cells are omitted
+            record = dict(zip(header, row))
+
+            if record.get('email') == email:
                 return record
 
+            # The sheet changed underneath the cached index; rebuild it and retry once
+            get_email_row_index.clear()
+
         return None
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to get user: {e}")
         return None
 
@@ -155,27 +533,25 @@ def update_reset_token(email: str, token: str, expiry: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        users_sheet = get_worksheet(config.SHEET_USERS)
+        if not users_sheet:
             return False
 
-        users_sheet = spreadsheet.worksheet(config.SHEET_USERS)
-
-        # Find the user's row
-        emails = users_sheet.col_values(3)  # Column C (email)
-
-        try:
-            row_index = emails.index(email) + 1
-        except ValueError:
+        # Find the user's row, confirming it still holds their email (column C)
+        row_index = _verified_rows(users_sheet, get_email_row_index, 'C', [email]).get(email)
+        if row_index is None:
             return False
 
-        # Update reset_token (column E) and token_expiry (column F)
-        users_sheet.update_cell(row_index, 5, token)
-        users_sheet.update_cell(row_index, 6, expiry)
+        # Update reset_token (column E) and token_expiry (column F) in one request
+        users_sheet.batch_update([{
+            'range': f'E{row_index}:F{row_index}',
+            'values': [[token, expiry]]
+        }])
 
         return True
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to update reset token: {e}")
         return False
 
@@ -184,50 +560,43 @@ def update_reset_token(email: str, token: str, expiry: str) -> bool:
 # Transaction Operations
 # =====================================
 
-@st.cache_data(ttl=config.CACHE_TTL)
-def load_user_transactions(_user_id: str) -> pd.DataFrame:
+def load_user_transactions(user_id: str) -> pd.DataFrame:
     """
-    Load all transactions for a user (cached)
+    Load all transactions for a user (cached until the user's transactions change)
 
     Args:
-        _user_id: User ID (prefixed with _ to prevent hashing)
+        user_id: User ID
 
     Returns:
         DataFrame with transactions
     """
-    try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
-            return pd.DataFrame()
-
-        transactions_sheet = spreadsheet.worksheet(config.SHEET_TRANSACTIONS)
+    return _load_user_transactions(user_id, _get_data_version('transactions', user_id))
 
-        # Get all records
-        records = transactions_sheet.get_all_records()
 
-        if not records:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(records)
-
-        # Filter by user_id
-        df = df[df['user_id'] == _user_id]
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+def _load_user_transactions(user_id: str, version: int) -> pd.DataFrame:
+    """
+    Load all transactions for a user (cached per user and version)
 
-        # Convert date column to datetime
-        if 'date' in df.columns and len(df) > 0:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    Args:
+        user_id: User ID (part of the cache key)
+        version: User's transactions version (part of the cache key)
 
-        # Convert amount to numeric
-        if 'amount' in df.columns and len(df) > 0:
-            df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
+    Returns:
+        DataFrame with transactions
+    """
+    try:
+        transactions_sheet = get_worksheet(config.SHEET_TRANSACTIONS)
+        if not transactions_sheet:
+            return pd.DataFrame()
 
-        # Sort by date descending
-        if len(df) > 0:
-            df = df.sort_values('date', ascending=False)
+        # Get raw values (numbers come back typed) and skip per-row dict building
+        values = transactions_sheet.get(TRANSACTIONS_RANGE, value_render_option='UNFORMATTED_VALUE')
 
-        return df
+        return _transactions_frame(values, user_id)
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to load transactions: {e}")
         return pd.DataFrame()
 
@@ -253,14 +622,12 @@ def add_transaction(user_id: str, date: str, payee: str, amount: float,
         True if successful, False otherwise
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        transactions_sheet = get_worksheet(config.SHEET_TRANSACTIONS)
+        if not transactions_sheet:
             return False
 
-        transactions_sheet = spreadsheet.worksheet(config.SHEET_TRANSACTIONS)
-
         transaction_id = str(uuid.uuid4())
-        created_at = datetime.now().strftime(config.DATETIME_FORMAT)
+        created_at = _now_timestamp()
 
         transactions_sheet.append_row([
             user_id,
@@ -278,11 +645,13 @@ def add_transaction(user_id: str, date: str, payee: str, amount: float,
         ])
 
         # Clear cache to force reload
-        load_user_transactions.clear()
+        _invalidate_user_data('transactions', user_id)
+        get_transaction_row_index.clear()
 
         return True
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to add transaction: {e}")
         return False
 
@@ -299,20 +668,16 @@ def batch_add_transactions(user_id: str, transactions: List[Dict[str, Any]]) ->
         True if successful, False otherwise
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        transactions_sheet = get_worksheet(config.SHEET_TRANSACTIONS)
+        if not transactions_sheet:
             return False
 
-        transactions_sheet = spreadsheet.worksheet(config.SHEET_TRANSACTIONS)
+        created_at = _now_timestamp()
 
-        created_at = datetime.now().strftime(config.DATETIME_FORMAT)
-
-        rows = []
-        for txn in transactions:
-            transaction_id = str(uuid.uuid4())
-            rows.append([
+        rows = [
+            [
                 user_id,
-                transaction_id,
+                str(uuid.uuid4()),  # transaction_id
                 txn.get('date', ''),
                 txn.get('payee', ''),
                 txn.get('amount', 0),
@@ -323,26 +688,31 @@ def batch_add_transactions(user_id: str, transactions: List[Dict[str, Any]]) ->
                 txn.get('pending', False),
                 created_at,
                 created_at
-            ])
+            ]
+            for txn in transactions
+        ]
 
         # Batch append
         transactions_sheet.append_rows(rows)
 
         # Clear cache
-        load_user_transactions.clear()
+        _invalidate_user_data('transactions', user_id)
+        get_transaction_row_index.clear()
 
         return True
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to batch add transactions: {e}")
         return False
 
 
-def update_transaction_category(transaction_id: str, category: str) -> bool:
+def update_transaction_category(user_id: str, transaction_id: str, category: str) -> bool:
     """
     Update the category of a transaction
 
     Args:
+        user_id: User ID (owner of the transaction)
         transaction_id: Transaction ID
         category: New category name
 
@@ -350,83 +720,85 @@ def update_transaction_category(transaction_id: str, category: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        transactions_sheet = get_worksheet(config.SHEET_TRANSACTIONS)
+        if not transactions_sheet:
             return False
 
-        transactions_sheet = spreadsheet.worksheet(config.SHEET_TRANSACTIONS)
-
-        # Find the transaction
-        transaction_ids = transactions_sheet.col_values(2)  # Column B
-
-        try:
-            row_index = transaction_ids.index(transaction_id) + 1
-        except ValueError:
+        # Find the transaction, confirming its row still holds the ID (column B)
+        row_index = _verified_rows(
+            transactions_sheet, get_transaction_row_index, 'B', [transaction_id]
+        ).get(transaction_id)
+        if row_index is None:
             st.error("Transaction not found")
             return False
 
-        # Update category (column F) and modified_at (column L)
-        modified_at = datetime.now().strftime(config.DATETIME_FORMAT)
-        transactions_sheet.update_cell(row_index, 6, category)
-        transactions_sheet.update_cell(row_index, 12, modified_at)
+        # Update category (column F) and modified_at (column L) in one request
+        modified_at = _now_timestamp()
+        transactions_sheet.batch_update([
+            {'range': f'F{row_index}', 'values': [[category]]},
+            {'range': f'L{row_index}', 'values': [[modified_at]]}
+        ])
 
         # Clear cache
-        load_user_transactions.clear()
+        _invalidate_user_data('transactions', user_id)
 
         return True
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to update transaction: {e}")
         return False
 
 
-def batch_update_transaction_categories(updates: List[tuple[str, str]]) -> bool:
+def batch_update_transaction_categories(user_id: str, updates: List[tuple[str, str]]) -> bool:
     """
     Update categories for multiple transactions in batch
 
     Args:
+        user_id: User ID (owner of the transactions)
         updates: List of (transaction_id, category) tuples
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        transactions_sheet = get_worksheet(config.SHEET_TRANSACTIONS)
+        if not transactions_sheet:
             return False
 
-        transactions_sheet = spreadsheet.worksheet(config.SHEET_TRANSACTIONS)
-
-        # Get all transaction IDs
-        transaction_ids = transactions_sheet.col_values(2)  # Column B
+        # Find the rows, confirming each still holds its transaction ID (column B)
+        row_index_by_id = _verified_rows(
+            transactions_sheet, get_transaction_row_index, 'B', [txn_id for txn_id, _ in updates]
+        )
 
-        modified_at = datetime.now().strftime(config.DATETIME_FORMAT)
+        modified_at = _now_timestamp()
 
         # Prepare batch update
         batch_updates = []
         for txn_id, category in updates:
-            try:
-                row_index = transaction_ids.index(txn_id) + 1
-                batch_updates.append({
-                    'range': f'F{row_index}',
-                    'values': [[category]]
-                })
-                batch_updates.append({
-                    'range': f'L{row_index}',
-                    'values': [[modified_at]]
-                })
-            except ValueError:
+            row_index = row_index_by_id.get(txn_id)
+            if row_index is None:
                 continue
 
+            batch_updates.append({
+                'range': f'F{row_index}',
+                'values': [[category]]
+            })
+            batch_updates.append({
+                'range': f'L{row_index}',
+                'values': [[modified_at]]
+            })
+
         if batch_updates:
             transactions_sheet.batch_update(batch_updates)
 
         # Clear cache
-        load_user_transactions.clear()
+        _invalidate_user_data('transactions', user_id)
 
         return True
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to batch update categories: {e}")
         return False
 
@@ -435,39 +807,42 @@ def batch_update_transaction_categories(updates: List[tuple[str, str]]) -> bool:
 # Rules Operations
 # =====================================
 
-@st.cache_data(ttl=config.CACHE_TTL)
-def load_user_rules(_user_id: str) -> pd.DataFrame:
+def load_user_rules(user_id: str) -> pd.DataFrame:
     """
-    Load all categorization rules for a user (cached)
+    Load all categorization rules for a user (cached until the user's rules change)
 
     Args:
-        _user_id: User ID
+        user_id: User ID
 
     Returns:
         DataFrame with rules
     """
-    try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
-            return pd.DataFrame()
+    return _load_user_rules(user_id, _get_data_version('rules', user_id))
 
-        rules_sheet = spreadsheet.worksheet(config.SHEET_USER_RULES)
 
-        records = rules_sheet.get_all_records()
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+def _load_user_rules(user_id: str, version: int) -> pd.DataFrame:
+    """
+    Load all categorization rules for a user (cached per user and version)
 
-        if not records:
-            return pd.DataFrame()
+    Args:
+        user_id: User ID (part of the cache key)
+        version: User's rules version (part of the cache key)
 
-        df = pd.DataFrame(records)
-        df = df[df['user_id'] == _user_id]
+    Returns:
+        DataFrame with rules
+    """
+    try:
+        rules_sheet = get_worksheet(config.SHEET_USER_RULES)
+        if not rules_sheet:
+            return pd.DataFrame()
 
-        # Sort by priority
-        if len(df) > 0 and 'priority' in df.columns:
-            df = df.sort_values('priority', ascending=True)
+        values = rules_sheet.get(RULES_RANGE, value_render_option='UNFORMATTED_VALUE')
 
-        return df
+        return _rules_frame(values, user_id)
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to load rules: {e}")
         return pd.DataFrame()
 
@@ -489,14 +864,12 @@ def add_rule(user_id: str, rule_field: str, rule_condition: str,
         True if successful, False otherwise
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        rules_sheet = get_worksheet(config.SHEET_USER_RULES)
+        if not rules_sheet:
             return False
 
-        rules_sheet = spreadsheet.worksheet(config.SHEET_USER_RULES)
-
         rule_id = str(uuid.uuid4())
-        created_at = datetime.now().strftime(config.DATETIME_FORMAT)
+        created_at = _now_timestamp()
 
         rules_sheet.append_row([
             user_id,
@@ -510,11 +883,12 @@ def add_rule(user_id: str, rule_field: str, rule_condition: str,
         ])
 
         # Clear cache
-        load_user_rules.clear()
+        _invalidate_user_data('rules', user_id)
 
         return True
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to add rule: {e}")
         return False
 
@@ -523,39 +897,44 @@ def add_rule(user_id: str, rule_field: str, rule_condition: str,
 # Budget Operations
 # =====================================
 
-@st.cache_data(ttl=config.CACHE_TTL)
-def load_user_budgets(_user_id: str, month_year: Optional[str] = None) -> pd.DataFrame:
+def load_user_budgets(user_id: str, month_year: Optional[str] = None) -> pd.DataFrame:
     """
-    Load budgets for a user (cached)
+    Load budgets for a user (cached until the user's budgets change)
 
     Args:
-        _user_id: User ID
+        user_id: User ID
         month_year: Optional month filter (YYYY-MM format)
 
     Returns:
         DataFrame with budgets
     """
-    try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
-            return pd.DataFrame()
+    return _load_user_budgets(user_id, _get_data_version('budgets', user_id), month_year)
 
-        budget_sheet = spreadsheet.worksheet(config.SHEET_BUDGET_MONTHLY)
 
-        records = budget_sheet.get_all_records()
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+def _load_user_budgets(user_id: str, version: int, month_year: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load budgets for a user (cached per user and version)
 
-        if not records:
-            return pd.DataFrame()
+    Args:
+        user_id: User ID (part of the cache key)
+        version: User's budgets version (part of the cache key)
+        month_year: Optional month filter (YYYY-MM format)
 
-        df = pd.DataFrame(records)
-        df = df[df['user_id'] == _user_id]
+    Returns:
+        DataFrame with budgets
+    """
+    try:
+        budget_sheet = get_worksheet(config.SHEET_BUDGET_MONTHLY)
+        if not budget_sheet:
+            return pd.DataFrame()
 
-        if month_year:
-            df = df[df['month_year'] == month_year]
+        values = budget_sheet.get(BUDGETS_RANGE, value_render_option='UNFORMATTED_VALUE')
 
-        return df
+        return _budgets_frame(values, user_id, month_year)
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to load budgets: {e}")
         return pd.DataFrame()
 
@@ -574,29 +953,22 @@ def set_budget(user_id: str, month_year: str, category: str, budgeted: float) ->
         True if successful, False otherwise
     """
     try:
-        spreadsheet = get_spreadsheet()
-        if not spreadsheet:
+        budget_sheet = get_worksheet(config.SHEET_BUDGET_MONTHLY)
+        if not budget_sheet:
             return False
 
-        budget_sheet = spreadsheet.worksheet(config.SHEET_BUDGET_MONTHLY)
+        # Check if budget already exists, confirming its row still holds the key (columns A:C)
+        key = (user_id, month_year, category)
+        row_index = _verified_rows(budget_sheet, get_budget_row_index, 'A:C', [key]).get(key)
 
-        # Check if budget already exists
-        records = budget_sheet.get_all_records()
-        df = pd.DataFrame(records)
-
-        existing = df[
-            (df['user_id'] == user_id) &
-            (df['month_year'] == month_year) &
-            (df['category'] == category)
-        ]
+        last_updated = _now_timestamp()
 
-        last_updated = datetime.now().strftime(config.DATETIME_FORMAT)
-
-        if len(existing) > 0:
+        if row_index is not None:
             # Update existing
-            row_index = existing.index[0] + 2  # +2 for header and 0-index
-            budget_sheet.update_cell(row_index, 4, budgeted)
-            budget_sheet.update_cell(row_index, 6, last_updated)
+            budget_sheet.batch_update([
+                {'range': f'D{row_index}', 'values': [[budgeted]]},
+                {'range': f'F{row_index}', 'values': [[last_updated]]}
+            ])
         else:
             # Create new
             budget_sheet.append_row([
@@ -607,12 +979,15 @@ def set_budget(user_id: str, month_year: str, category: str, budgeted: float) ->
                 0,  # spent (calculated separately)
                 last_updated
             ])
+            get_budget_row_index.clear()
 
         # Clear cache
-        load_user_budgets.clear()
+        _invalidate_user_data('budgets', user_id)
 
         return True
 
     except Exception as e:
+        _drop_sheet_handles()
         st.error(f"Failed to set budget: {e}")
         return False
+
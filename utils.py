@@ -2,11 +2,38 @@
 Utility functions for FinDash
 """
 
+import re
 import pandas as pd
 from typing import List, Tuple
 import config
 
 
+# Lower-cased keywords per category, in priority order, computed once at import
+CATEGORY_KEYWORDS_LOWER = tuple(
+    (category, tuple(keyword.lower() for keyword in keywords))
+    for category, keywords in config.CATEGORY_KEYWORDS.items()
+)
+
+# One union regex per category, in priority order, compiled once at import
+CATEGORY_KEYWORD_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in CATEGORY_KEYWORDS_LOWER
+]
+
+# Regex template per rule condition; {} is the escaped union of rule values
+RULE_CONDITION_PATTERNS = {
+    'contains': '(?:{})',
+    'equals': r'^(?:{})\Z',
+    'starts_with': '^(?:{})',
+    'ends_with': r'(?:{})\Z',
+}
+
+# Anchored conditions whose alternatives are tried in order at the start of
+# the value, so rules for different categories can share one regex without
+# breaking priority order
+RULE_CONDITIONS_MERGEABLE = {'equals', 'starts_with'}
+
+
 def auto_categorize_transaction(payee: str) -> str:
     """
     Auto-categorize a transaction based on payee using keyword matching
@@ -23,14 +50,45 @@ def auto_categorize_transaction(payee: str) -> str:
     payee_lower = payee.lower()
 
     # Check against keyword dictionary
-    for category, keywords in config.CATEGORY_KEYWORDS.items():
+    for category, keywords in CATEGORY_KEYWORDS_LOWER:
         for keyword in keywords:
-            if keyword.lower() in payee_lower:
+            if keyword in payee_lower:
                 return category
 
     return "Uncategorized"
 
 
+def auto_categorize_payees(payees: pd.Series) -> pd.Series:
+    """
+    Auto-categorize many payees at once using keyword matching
+
+    Column-wise equivalent of auto_categorize_transaction: one scan per
+    category instead of one Python call per payee.
+
+    Args:
+        payees: Series of payee/merchant names
+
+    Returns:
+        Series of category names aligned with payees
+    """
+    # Plain object strings so str.contains accepts a compiled pattern
+    payees_lower = payees.astype(str).astype(object).str.lower()
+
+    categories = pd.Series('Uncategorized', index=payees.index, dtype=object)
+    unmatched = pd.Series(True, index=payees.index)
+
+    for category, pattern in CATEGORY_KEYWORD_PATTERNS:
+        if not unmatched.any():
+            break
+
+        # First matching category wins
+        mask = unmatched & payees_lower.str.contains(pattern, na=False)
+        categories[mask] = category
+        unmatched &= ~mask
+
+    return categories
+
+
 def apply_rule(transaction: pd.Series, rule: pd.Series) -> bool:
     """
     Check if a rule applies to a transaction
@@ -58,6 +116,66 @@ def apply_rule(transaction: pd.Series, rule: pd.Series) -> bool:
         return False
 
 
+def compile_rule_patterns(rules_df: pd.DataFrame) -> List[Tuple[str, re.Pattern, Tuple[str, ...]]]:
+    """
+    Compile runs of consecutive rules into one regex per field and condition
+
+    Only consecutive rules are merged, so priority order is preserved.
+    Contains and ends_with runs are split by category; equals and
+    starts_with runs may span categories, with one capture group per
+    category telling which rule fired.
+
+    Args:
+        rules_df: DataFrame of rules (sorted by priority)
+
+    Returns:
+        List of (rule_field, compiled pattern, rule_categories) tuples in priority order
+    """
+    groups = []
+
+    rule_columns = zip(
+        rules_df['rule_field'].to_numpy(),
+        rules_df['rule_condition'].to_numpy(),
+        rules_df['rule_category'].to_numpy(),
+        rules_df['rule_value'].to_numpy()
+    )
+
+    for field, condition, category, rule_value in rule_columns:
+        if condition in RULE_CONDITIONS_MERGEABLE:
+            key = (field, condition)
+        else:
+            key = (field, condition, category)
+        value = re.escape(str(rule_value).lower())
+
+        if not groups or groups[-1][0] != key:
+            groups.append((key, []))
+
+        # Each group holds (category, values) runs in priority order
+        runs = groups[-1][1]
+        if runs and runs[-1][0] == category:
+            runs[-1][1].append(value)
+        else:
+            runs.append((category, [value]))
+
+    patterns = []
+
+    for key, runs in groups:
+        field, condition = key[0], key[1]
+        template = RULE_CONDITION_PATTERNS.get(condition)
+        if template is None:
+            continue  # Unknown conditions never match
+
+        categories = tuple(category for category, _ in runs)
+        if len(runs) == 1:
+            body = '|'.join(runs[0][1])
+        else:
+            body = '|'.join(f"({'|'.join(values)})" for _, values in runs)
+
+        patterns.append((field, re.compile(template.format(body)), categories))
+
+    return patterns
+
+
 def apply_rules_to_transactions(transactions_df: pd.DataFrame, rules_df: pd.DataFrame) -> List[Tuple[str, str]]:
     """
     Apply categorization rules to transactions
@@ -69,17 +187,49 @@ def apply_rules_to_transactions(transactions_df: pd.DataFrame, rules_df: pd.Data
     Returns:
         List of (transaction_id, category) tuples for batch update
     """
-    updates = []
+    if len(transactions_df) == 0 or len(rules_df) == 0:
+        return []
+
+    # Compiled from the rows given, so a filtered rules frame applies only its own rules
+    rule_patterns = compile_rule_patterns(rules_df)
+
+    # Lower-case each referenced field once (plain object strings so
+    # str.contains accepts a compiled pattern)
+    lower_fields = {}
+    for field in {field for field, _, _ in rule_patterns}:
+        if field in transactions_df.columns:
+            lower_fields[field] = transactions_df[field].astype(str).astype(object).str.lower()
+        else:
+            lower_fields[field] = pd.Series('', index=transactions_df.index, dtype=object)
 
-    for _, txn in transactions_df.iterrows():
-        for _, rule in rules_df.iterrows():
-            if apply_rule(txn, rule):
-                # Only update if category changed
-                if txn['category'] != rule['rule_category']:
-                    updates.append((txn['transaction_id'], rule['rule_category']))
-                break  # Stop at first matching rule (highest priority)
+    new_category = pd.Series(None, index=transactions_df.index, dtype=object)
+    unmatched = pd.Series(True, index=transactions_df.index)
 
-    return updates
+    # First matching rule wins (highest priority)
+    for field, pattern, categories in rule_patterns:
+        if not unmatched.any():
+            break
+
+        if len(categories) == 1:
+            mask = unmatched & lower_fields[field].str.contains(pattern, na=False)
+            new_category[mask] = categories[0]
+            unmatched &= ~mask
+            continue
+
+        # One capture group per category; the first group that took part in
+        # the match belongs to the rule that fired
+        fired = lower_fields[field][unmatched].str.extract(pattern).notna()
+        hit = fired.to_numpy().any(axis=1)
+        first = fired.to_numpy().argmax(axis=1)[hit]
+        hit_index = fired.index[hit]
+
+        new_category[hit_index] = [categories[i] for i in first]
+        unmatched[hit_index] = False
+
+    # Only update if category changed
+    changed = new_category.notna() & (new_category != transactions_df['category'].astype(object))
+
+    return list(zip(transactions_df.loc[changed, 'transaction_id'], new_category[changed]))
 
 
 def calculate_budget_progress(budgets_df: pd.DataFrame, transactions_df: pd.DataFrame) -> pd.DataFrame:
@@ -94,7 +244,7 @@ def calculate_budget_progress(budgets_df: pd.DataFrame, transactions_df: pd.Data
         DataFrame with budgeted and spent columns
     """
     # Calculate spending by category (only negative amounts)
-    spending = transactions_df[transactions_df['amount'] < 0].groupby('category')['amount'].sum()
+    spending = transactions_df[transactions_df['amount'] < 0].groupby('category', observed=True)['amount'].sum()
 
     # Merge with budgets
     result = budgets_df.copy()
@@ -165,6 +315,20 @@ def get_month_name(month_year: str) -> str:
         return month_year
 
 
+def get_current_month() -> pd.Period:
+    """
+    Get the current month as a monthly Period
+
+    str() of the result is already in YYYY-MM format.
+
+    Returns:
+        Current month Period
+    """
+    from datetime import datetime
+
+    return pd.Period(datetime.now(), freq='M')
+
+
 def calculate_trend(current: float, previous: float) -> Tuple[float, str]:
     """
     Calculate percentage change and direction
@@ -219,11 +383,12 @@ def get_top_merchants(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     Returns:
         DataFrame with merchant and total spending
     """
-    # Only negative amounts (expenses)
-    expenses = df[df['amount'] < 0].copy()
-    expenses['amount'] = expenses['amount'].abs()
+    # Only negative amounts (expenses), negated instead of copying the frame and taking abs()
+    amounts = df['amount'].to_numpy()
+    expenses = amounts < 0
+    payees = df['payee'].to_numpy()[expenses]
 
-    top = expenses.groupby('payee')['amount'].sum().sort_values(ascending=False).head(n)
+    top = pd.Series(-amounts[expenses]).groupby(payees).sum().nlargest(n)
 
     return pd.DataFrame({
         'Merchant': top.index,
@@ -242,8 +407,10 @@ def calculate_monthly_summary(df: pd.DataFrame, month_year: str) -> dict:
     Returns:
         Dictionary with summary statistics
     """
-    # Filter to month
-    month_df = df[df['date'].dt.strftime(config.MONTH_YEAR_FORMAT) == month_year]
+    # Filter to month by comparing YYYYMM integers instead of formatting every date
+    target = int(month_year[:4]) * 100 + int(month_year[5:7])
+    year_month = df['date'].dt.year * 100 + df['date'].dt.month
+    month_df = df[year_month.to_numpy() == target]
 
     if len(month_df) == 0:
         return {